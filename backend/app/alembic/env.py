@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 from logging.config import fileConfig
@@ -6,42 +7,50 @@ from pathlib import Path
 import db.models  # noqa: F401
 from alembic import context
 from sqlalchemy import engine_from_config, pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import async_engine_from_config
 from sqlmodel import SQLModel
 
 # -------------------------------------------------------
 # PATH SETUP
 # -------------------------------------------------------
-# Add app/ directory to sys.path so we can import our modules
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# Resolve app/ once: app/alembic/env.py -> app
+APP_DIR = Path(__file__).resolve().parent.parent
+
+# Add app/ directory to sys.path so we can import our modules.
+# Guarded so programmatic re-runs don't stack duplicate entries.
+if str(APP_DIR) not in sys.path:
+    sys.path.insert(0, str(APP_DIR))
 
 # -------------------------------------------------------
 # DATABASE URL SETUP
 # -------------------------------------------------------
-# Load DATABASE_URL directly from .env using python-dotenv.
+# Read DATABASE_URL from the environment, falling back to .env via
+# python-dotenv only when it isn't already set (e.g. in Docker/CI).
 # We intentionally avoid importing Settings from config.py
 # because it requires all Azure credentials to be present,
 # which Alembic doesn't need.
 
-from dotenv import load_dotenv
-
-# .env is two levels up from env.py: app/alembic/env.py -> project root
-env_file = Path(__file__).resolve().parent.parent.parent / ".env"
+database_url = os.environ.get("DATABASE_URL")
+if not database_url:
+    from dotenv import load_dotenv
 
-if env_file.exists():
-    load_dotenv(env_file)
+    # .env lives in the project root, one level above app/
+    load_dotenv(APP_DIR.parent / ".env")
+    database_url = os.environ.get("DATABASE_URL")
 
-database_url = os.getenv("DATABASE_URL")
 if not database_url:
     raise ValueError("DATABASE_URL is not set.")
 
-# Alembic runs synchronously (it's a CLI tool, not an async server).
-# psycopg3 async driver (postgresql+psycopg://) requires SelectorEventLoop
-# on Windows, but Alembic doesn't need async at all.
-# We convert to the sync psycopg3 driver to avoid all event loop issues.
-database_url = database_url.replace("postgresql+psycopg://", "postgresql+psycopg://")
-
-# If you want to be extra safe, use the explicit sync driver:
-# database_url = database_url.replace("postgresql+psycopg://", "postgresql://")
+# Alembic drives the same psycopg3 URL as the app, either through a sync
+# engine (CLI default) or an async engine (-x async=true).
+# psycopg3 async (postgresql+psycopg://) requires SelectorEventLoop on
+# Windows; run_migrations_online() takes care of that.
+# An explicit "+psycopg_async" URL is normalized to "+psycopg"; the same
+# URL then works with both engine_from_config and async_engine_from_config.
+_ASYNC_PREFIX = "postgresql+psycopg_async://"
+if database_url.startswith(_ASYNC_PREFIX):
+    database_url = "postgresql+psycopg://" + database_url[len(_ASYNC_PREFIX) :]
 
 
 # -------------------------------------------------------
@@ -90,13 +99,23 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """
-    Run migrations in 'online' mode.
-    Connects to database and applies migrations directly.
-    Uses synchronous engine - no async/event loop issues.
+def do_run_migrations(connection: Connection) -> None:
+    """Configure the migration context on an open connection and run it."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+        compare_server_default=True,
+    )
 
-    Usage: alembic upgrade head
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_sync_migrations() -> None:
+    """
+    Build a synchronous engine from the Alembic config and run migrations.
+    No event loop is needed, which keeps plain CLI runs simple.
     """
     configuration = config.get_section(config.config_ini_section, {})
     configuration["sqlalchemy.url"] = database_url  # type: ignore
@@ -108,15 +127,59 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            compare_type=True,
-            compare_server_default=True,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        do_run_migrations(connection)
+
+
+async def run_async_migrations() -> None:
+    """
+    Build an async engine from the Alembic config and run migrations
+    over a single connection via run_sync().
+    """
+    configuration = config.get_section(config.config_ini_section, {})
+    configuration["sqlalchemy.url"] = database_url  # type: ignore
+
+    # Migrations run over exactly one connection; size the pool to match.
+    connectable = async_engine_from_config(
+        configuration,
+        prefix="sqlalchemy.",
+        pool_size=1,
+        max_overflow=0,
+    )
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    """
+    Run migrations in 'online' mode.
+    Connects to database and applies migrations directly.
+
+    If a connection is supplied via config.attributes["connection"]
+    (e.g. from a test fixture calling ``conn.run_sync(...)``), it is reused
+    as-is. Otherwise the CLI uses a synchronous engine, or an async engine
+    when invoked with ``-x async=true``.
+
+    Usage: alembic upgrade head
+           alembic -x async=true upgrade head
+    """
+    connection = config.attributes.get("connection", None)
+
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    use_async = context.get_x_argument(as_dictionary=True).get("async", "")
+    if use_async.lower() not in ("1", "true", "yes"):
+        run_sync_migrations()
+        return
+
+    if sys.platform == "win32":
+        asyncio.run(run_async_migrations(), loop_factory=asyncio.SelectorEventLoop)
+    else:
+        asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
@@ -0,0 +1,58 @@
+"""add covering cost indexes
+
+Revision ID: 3f9d2c1a7b44
+Revises: 72c6d4d3a714
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9d2c1a7b44"
+down_revision: Union[str, Sequence[str], None] = "72c6d4d3a714"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("idx_daily_cost_billing_period", table_name="daily_cost")
+    op.create_index(
+        "idx_daily_cost_period_date",
+        "daily_cost",
+        ["billing_period_id", "usage_date"],
+        unique=False,
+        postgresql_include=["cost_amount", "currency_code"],
+    )
+
+    op.drop_index("idx_service_cost_service_period", table_name="service_cost")
+    op.create_index(
+        "idx_service_cost_period_service",
+        "service_cost",
+        ["billing_period_id", "service_id"],
+        unique=False,
+        postgresql_include=["cost_amount", "currency_code"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_service_cost_period_service", table_name="service_cost")
+    op.create_index(
+        "idx_service_cost_service_period",
+        "service_cost",
+        ["service_id", "billing_period_id"],
+        unique=False,
+    )
+
+    op.drop_index("idx_daily_cost_period_date", table_name="daily_cost")
+    op.create_index(
+        "idx_daily_cost_billing_period",
+        "daily_cost",
+        ["billing_period_id"],
+        unique=False,
+    )
@@ -0,0 +1,36 @@
+"""server side cost timestamps
+
+Revision ID: 8b1e4d6f2a90
+Revises: 3f9d2c1a7b44
+Create Date: 2026-10-15 09:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b1e4d6f2a90"
+down_revision: Union[str, Sequence[str], None] = "3f9d2c1a7b44"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("service_cost", "daily_cost")
+_COLUMNS = ("fetched_at", "created_at", "updated_at")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _TABLES:
+        for column in _COLUMNS:
+            op.alter_column(table, column, server_default=None)
@@ -0,0 +1,29 @@
+"""drop redundant azure_service name index
+
+Revision ID: c47a9e03d5b1
+Revises: 8b1e4d6f2a90
+Create Date: 2026-10-15 09:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c47a9e03d5b1"
+down_revision: Union[str, Sequence[str], None] = "8b1e4d6f2a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The UNIQUE constraint on azure_service.name already provides a btree index
+    op.drop_index("idx_azure_service_name", table_name="azure_service")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("idx_azure_service_name", "azure_service", ["name"], unique=False)
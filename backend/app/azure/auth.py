@@ -1,50 +1,127 @@
-from typing import Optional
+import threading
+import time
+from typing import Any, Optional
 
-from azure.identity import ClientSecretCredential
+from azure.identity import (
+    ChainedTokenCredential,
+    ClientSecretCredential,
+    ManagedIdentityCredential,
+)
+from azure.core.credentials import AccessToken, TokenCredential
 from azure.core.exceptions import ClientAuthenticationError
 from config import settings
 
+# Seconds before expiry at which a cached token is considered stale
+TOKEN_REFRESH_OFFSET: int = 300
+# Azure Resource Manager scope used by the Cost Management client
+ARM_SCOPE: str = "https://management.azure.com/.default"
+
+
+class CachedCredential:
+    """
+    Token-caching proxy around an Azure credential.
+
+    Returns the cached AccessToken for a given set of scopes until it is
+    within TOKEN_REFRESH_OFFSET seconds of expiry, then delegates to the
+    wrapped credential. Requests carrying extra options (claims, tenant_id,
+    ...) always bypass the cache.
+    """
+
+    def __init__(self, credential: TokenCredential) -> None:
+        self._credential = credential
+        self._tokens: dict[tuple[str, ...], AccessToken] = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        if any(kwargs.values()):
+            return self._credential.get_token(*scopes, **kwargs)
+
+        return self._cached_token(scopes, TOKEN_REFRESH_OFFSET)
+
+    def refresh_if_expiring(self, *scopes: str, within: int) -> AccessToken:
+        """
+        Fetch a new token now if the cached one expires within ``within``
+        seconds, so request paths never wait on the AAD round trip.
+        """
+        return self._cached_token(scopes, within)
+
+    def _cached_token(self, scopes: tuple[str, ...], min_validity: int) -> AccessToken:
+        key = tuple(scopes)
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is not None and token.expires_on - time.time() > min_validity:
+                return token
+
+            token = self._credential.get_token(*scopes)
+            self._tokens[key] = token
+            return token
+
+    def close(self) -> None:
+        self._credential.close()
+
+
 # Cached credential instance to avoid creating multiple credential objects
-_AZURE_CREDENTIAL: Optional[ClientSecretCredential] = None
+_AZURE_CREDENTIAL: Optional[CachedCredential] = None
+# Guards first-time construction so concurrent callers share one credential
+_CRED_LOCK = threading.Lock()
 
 
-def get_azure_credential() -> ClientSecretCredential:
+def get_azure_credential() -> CachedCredential:
     """
-    Returns a cached Azure ClientSecretCredential instance.
+    Returns a cached Azure credential wrapped in a CachedCredential.
 
-    Uses singleton pattern to reuse the same credential object across calls.
-    The Azure SDK automatically handles token refresh, so we only need
-    to create the credential once.
+    When AZURE_MANAGED_IDENTITY_CLIENT_ID is set, that user-assigned managed
+    identity (local IMDS endpoint) is tried first and the service principal's
+    client secret is used as a fallback; otherwise only the
+    ClientSecretCredential is used.
+
+    Uses a double-checked singleton so the same credential object is reused
+    across calls and threads. The fast path reads the cached instance without
+    taking the lock; only the first caller(s) contend on construction.
+    Access tokens are cached per scope set and only refreshed shortly
+    before they expire, so repeated SDK calls skip the AAD round trip.
 
     Returns:
-        ClientSecretCredential: Authenticated Azure credential object
+        CachedCredential: Authenticated, token-caching Azure credential object
 
     Raises:
-        ValueError: If required Azure credentials are missing
         ClientAuthenticationError: If authentication fails
     """
     global _AZURE_CREDENTIAL
 
-    # Return cached credential if already initialized
-    if _AZURE_CREDENTIAL is None:
-        try:
-            if not all(
-                [
-                    settings.AZURE_TENANT_ID,
-                    settings.AZURE_CLIENT_ID,
-                    settings.AZURE_CLIENT_SECRET,
-                ]
-            ):
-                raise ValueError("Missing required Azure credentials in settings")
-
-            _AZURE_CREDENTIAL = ClientSecretCredential(
-                tenant_id=settings.AZURE_TENANT_ID,
-                client_id=settings.AZURE_CLIENT_ID,
-                client_secret=settings.AZURE_CLIENT_SECRET,
-            )
-        except ClientAuthenticationError as e:
-            raise ClientAuthenticationError(f"Failed to authenticate with Azure: {e}")
-        except Exception as e:
-            raise Exception(f"Failed to create Azure credential: {e}")
-
-    return _AZURE_CREDENTIAL
+    # Fast path: return cached credential without locking
+    credential = _AZURE_CREDENTIAL
+    if credential is not None:
+        return credential
+
+    with _CRED_LOCK:
+        # Re-check: another thread may have initialized it while we waited
+        credential = _AZURE_CREDENTIAL
+        if credential is None:
+            try:
+                credentials: list[TokenCredential] = []
+                if settings.AZURE_MANAGED_IDENTITY_CLIENT_ID:
+                    credentials.append(
+                        ManagedIdentityCredential(
+                            client_id=settings.AZURE_MANAGED_IDENTITY_CLIENT_ID
+                        )
+                    )
+                # Presence of the credentials is enforced by Settings validation
+                credentials.append(
+                    ClientSecretCredential(
+                        tenant_id=settings.AZURE_TENANT_ID,
+                        client_id=settings.AZURE_CLIENT_ID,
+                        client_secret=settings.AZURE_CLIENT_SECRET,
+                    )
+                )
+                credential = CachedCredential(ChainedTokenCredential(*credentials))
+            except ClientAuthenticationError as e:
+                raise ClientAuthenticationError(
+                    f"Failed to authenticate with Azure: {e}"
+                )
+            except Exception as e:
+                raise Exception(f"Failed to create Azure credential: {e}")
+
+            _AZURE_CREDENTIAL = credential
+
+    return credential
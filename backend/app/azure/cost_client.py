@@ -5,18 +5,26 @@ Provides a singleton CostManagementClient instance for interacting with
 Azure Cost Management APIs.
 """
 
+import threading
+from functools import lru_cache
+
 from azure.auth import get_azure_credential
 from azure.mgmt.costmanagement import CostManagementClient
 from config import settings
 
 # Singleton instance of the CostManagementClient
 _COST_CLIENT = None
+# Guards first-time construction so concurrent callers share one client
+_CLIENT_LOCK = threading.Lock()
 
 
 def get_cost_client() -> CostManagementClient:
     """
     Get or create a singleton CostManagementClient instance.
 
+    Uses double-checked locking so concurrent callers never build more
+    than one client per process.
+
     Returns:
         CostManagementClient: Authenticated client for Azure Cost Management API.
 
@@ -25,16 +33,26 @@ def get_cost_client() -> CostManagementClient:
                       or configuration issues.
     """
     global _COST_CLIENT
+
+    # Fast path: return cached client without locking
+    client = _COST_CLIENT
+    if client is not None:
+        return client
+
     try:
-        if _COST_CLIENT is None:
-            # Obtain Azure credentials from the auth module
-            credential = get_azure_credential()
-            # Initialize the Cost Management client with credentials and subscription
-            _COST_CLIENT = CostManagementClient(
-                credential=credential,
-                subscription_id=settings.AZURE_SUBSCRIPTION_ID,
-            )
-        return _COST_CLIENT
+        with _CLIENT_LOCK:
+            # Re-check: another thread may have initialized it while we waited
+            client = _COST_CLIENT
+            if client is None:
+                # Obtain Azure credentials from the auth module
+                credential = get_azure_credential()
+                # Initialize the Cost Management client with credentials and subscription
+                client = CostManagementClient(
+                    credential=credential,
+                    subscription_id=settings.AZURE_SUBSCRIPTION_ID,
+                )
+                _COST_CLIENT = client
+        return client
 
     except Exception as exc:
         raise RuntimeError(
@@ -43,6 +61,7 @@ def get_cost_client() -> CostManagementClient:
         ) from exc
 
 
+@lru_cache(maxsize=1)
 def subscription_scope() -> str:
     """
     Build the Azure Resource Manager scope string for the current subscription.
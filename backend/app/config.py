@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 from pydantic import Field, PostgresDsn, model_validator, field_validator, EmailStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -15,6 +16,12 @@ class Environment(str, Enum):
     TESTING = "testing"
 
 
+_LOGGING_FILE = logging.__file__
+
+# Stack depth from emit() to the original caller, memoized per call site
+_CALLER_DEPTHS: dict[tuple[str, int], int] = {}
+
+
 class InterceptHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
         level: str | int
@@ -23,18 +30,32 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        frame, depth = logging.currentframe(), 2
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
+        # The frames between a given call site and this handler never change,
+        # so walk the stack once per (file, line) and reuse the result.
+        call_site = (record.pathname, record.lineno)
+        depth = _CALLER_DEPTHS.get(call_site)
+        if depth is None:
+            frame, depth = logging.currentframe(), 2
+            while frame and frame.f_code.co_filename == _LOGGING_FILE:
+                frame = frame.f_back
+                depth += 1
+            _CALLER_DEPTHS[call_site] = depth
 
         logger.opt(depth=depth, exception=record.exc_info).log(
             level, record.getMessage()
         )
 
 
-def setup_logging(debug: bool = False) -> None:
-    """Configure logging to use loguru for uvicorn logs."""
+def setup_logging(
+    debug: bool = False, enqueue: bool = False, serialize: bool = False
+) -> None:
+    """Configure logging to use loguru for uvicorn logs.
+
+    ``enqueue`` routes records through loguru's multiprocess-safe queue; it is
+    only worth its per-record pickling cost when several workers share stdout.
+    ``serialize`` emits one JSON object per record for log collectors.
+    ANSI colors are only generated when stdout is a terminal.
+    """
     log_level = logging.DEBUG if debug else logging.INFO
 
     logger.remove()
@@ -42,8 +63,9 @@ def setup_logging(debug: bool = False) -> None:
         sys.stdout,
         level=log_level,
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <7}</level> | <level>{message}</level>",
-        colorize=True,
-        enqueue=True,
+        colorize=sys.stdout.isatty(),
+        serialize=serialize,
+        enqueue=enqueue,
     )
 
     for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
@@ -81,6 +103,10 @@ class Settings(BaseSettings):
     AZURE_TENANT_ID: str = Field(..., min_length=20)
     AZURE_CLIENT_SECRET: str = Field(..., min_length=20)
     AZURE_SUBSCRIPTION_ID: str = Field(..., min_length=20)
+    AZURE_MANAGED_IDENTITY_CLIENT_ID: str | None = Field(
+        default=None,
+        description="Client id of a user-assigned managed identity to try first",
+    )
 
     # Server configuration
     HOST: str = Field(default="127.0.0.1")
@@ -88,6 +114,18 @@ class Settings(BaseSettings):
 
     # Database configuration
     DATABASE_URL: PostgresDsn = Field(...)
+    DB_POOL_SIZE: int = Field(
+        default=10, ge=1, description="Persistent connections kept in the pool"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=20, ge=0, description="Extra connections allowed above pool size"
+    )
+    DB_POOL_TIMEOUT: int = Field(
+        default=30, ge=1, description="Seconds to wait for a pooled connection"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=1800, ge=-1, description="Seconds before a connection is recycled"
+    )
 
     # Scheduler configuration
     ENABLE_SCHEDULER: bool = Field(
@@ -233,10 +271,25 @@ class Settings(BaseSettings):
         return v
 
 
-settings = Settings()
-
-setup_logging(debug=settings.show_debug_info)
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """
+    Build the application Settings on first use and cache them.
+
+    Environment/.env parsing and logging setup only happen once, and only
+    in processes that actually need configuration.
+    """
+    settings = Settings()
+    setup_logging(
+        debug=settings.show_debug_info,
+        enqueue=settings.is_production,
+        serialize=settings.is_production,
+    )
     return settings
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``config.settings`` lazily via get_settings()."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -86,7 +86,7 @@ async def update_threshold(
         threshold.absolute_threshold = payload.absolute_threshold
     if payload.is_active is not None:
         threshold.is_active = payload.is_active
-    threshold.updated_at = datetime.now(timezone.utc)
+    threshold.updated_at = func.now()
 
     session.add(threshold)
     await session.commit()
@@ -104,7 +104,7 @@ async def deactivate_threshold(
         raise ValueError(f"AlertThreshold id={threshold_id} not found.")
 
     threshold.is_active = False
-    threshold.updated_at = datetime.now(timezone.utc)
+    threshold.updated_at = func.now()
     session.add(threshold)
     await session.commit()
     await session.refresh(threshold)
@@ -404,8 +404,8 @@ async def update_anomaly_settings(
         row.email_enabled = payload.email_enabled
     if "receiver_email" in payload.model_fields_set:
         row.receiver_email = payload.receiver_email
+    row.updated_at = func.now()
 
-    row.updated_at = datetime.now(timezone.utc)
     session.add(row)
     await session.commit()
     await session.refresh(row)
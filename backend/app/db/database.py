@@ -3,8 +3,15 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 import asyncio
 
+import psycopg
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 import db.models  # noqa: F401
@@ -16,13 +23,26 @@ engine: AsyncEngine = create_async_engine(
     settings.database_url_string,
     echo=settings.DEBUG,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=3600,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     echo_pool=settings.DEBUG,
+    connect_args={
+        "application_name": "azure-cost-analyzer",
+        "connect_timeout": 10,
+        # TCP keepalives so dead idle connections are noticed by the kernel
+        "keepalives": 1,
+        "keepalives_idle": 60,
+        "keepalives_interval": 10,
+        "keepalives_count": 5,
+        # Disable PostgreSQL JIT: it only adds planning overhead for our short
+        # queries. Also cap statement runtime at 60s.
+        "options": "-c jit=off -c statement_timeout=60000",
+    },
 )
 
+
 async_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -40,6 +60,9 @@ async def wait_for_db(
     """
     Wait for database to become available with exponential backoff.
 
+    Each attempt pings the server with a bare psycopg connection instead of
+    going through the engine, so failed attempts never touch the pool.
+
     Args:
         max_retries: Maximum number of connection attempts
         retry_interval: Initial wait time between retries in seconds
@@ -52,11 +75,21 @@ async def wait_for_db(
         ConnectionError: If database is unreachable after all retries
     """
     current_interval = retry_interval
+    # libpq DSN for the raw driver: strip the SQLAlchemy "+psycopg" suffix
+    dsn = (
+        make_url(settings.database_url_string)
+        .set(drivername="postgresql")
+        .render_as_string(hide_password=False)
+    )
 
     for attempt in range(1, max_retries + 1):
         try:
-            async with engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
+            conn = await asyncio.wait_for(
+                psycopg.AsyncConnection.connect(dsn, connect_timeout=2),
+                timeout=2.0,
+            )
+            async with conn:
+                await conn.execute("SELECT 1")
                 if settings.show_debug_info:
                     logger.info(
                         f"Database connection established (attempt {attempt}/{max_retries})"
@@ -92,6 +125,40 @@ async def wait_for_db(
     return False
 
 
+async def warmup_pool(n: int | None = None) -> None:
+    """
+    Open ``n`` pool connections concurrently so the first requests after
+    startup don't pay connection setup cost. Defaults to the configured pool
+    size. Failures are logged, not raised.
+    """
+    n = n or settings.DB_POOL_SIZE
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(n)), return_exceptions=True
+    )
+    conns = [r for r in results if isinstance(r, AsyncConnection)]
+    failures = [r for r in results if not isinstance(r, AsyncConnection)]
+    try:
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+        if not failures:
+            logger.info(f"Database pool warmed up with {len(conns)} connections")
+        elif settings.show_debug_info:
+            logger.warning(
+                f"Database pool warmed up with {len(conns)} of {n} connections: "
+                f"{failures[0]!r}"
+            )
+        else:
+            logger.warning(
+                f"Database pool warmed up with {len(conns)} of {n} connections"
+            )
+    except Exception as e:
+        if settings.show_debug_info:
+            logger.warning(f"Database pool warmup failed: {e}")
+        else:
+            logger.warning("Database pool warmup failed")
+    finally:
+        await asyncio.gather(*(conn.close() for conn in conns))
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides an async database session.
@@ -129,7 +196,22 @@ async def get_session_context() -> AsyncGenerator[AsyncSession, None]:
 async def init_db() -> None:
     """Initialize the database by creating all tables.
     Schema is managed by Alembic - run 'alembic upgrade head' separately.
+
+    Probes through a pooled engine connection first, so the handshake is
+    kept for later requests; the wait_for_db() retry loop only runs if that
+    first attempt fails.
     """
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        logger.info("Database connection established")
+        return
+    except Exception as e:
+        if settings.show_debug_info:
+            logger.warning(f"Initial database connection failed: {e}")
+        else:
+            logger.warning("Initial database connection failed")
+
     await wait_for_db()
 
 
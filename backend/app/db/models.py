@@ -13,7 +13,10 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     Enum as SAEnum,
+    func,
+    text,
 )
+from sqlalchemy.orm import configure_mappers
 from typing import Optional
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -31,7 +34,6 @@ def _utcnow() -> datetime:
 
 class AzureService(SQLModel, table=True):
     __tablename__ = "azure_service"
-    __table_args__ = (Index("idx_azure_service_name", "name"),)
 
     id: int | None = Field(
         default=None, primary_key=True, sa_column_kwargs={"autoincrement": True}
@@ -69,6 +71,13 @@ class BillingPeriod(SQLModel, table=True):
     __tablename__ = "billing_period"
     __table_args__ = (
         UniqueConstraint("start_date", "end_date", name="uq_billing_period_dates"),
+        # At most one current period; non-current rows stay out of the index
+        Index(
+            "idx_billing_period_current_true",
+            "is_current",
+            unique=True,
+            postgresql_where=text("is_current = true"),
+        ),
     )
 
     id: int | None = Field(
@@ -104,7 +113,13 @@ class ServiceCost(SQLModel, table=True):
         ),
         CheckConstraint("cost_amount >= 0", name="ck_service_cost_amount_positive"),
         CheckConstraint("LENGTH(currency_code) = 3", name="ck_currency_code_length"),
-        Index("idx_service_cost_service_period", "service_id", "billing_period_id"),
+        # Covering index: per-period cost scans are served index-only
+        Index(
+            "idx_service_cost_period_service",
+            "billing_period_id",
+            "service_id",
+            postgresql_include=["cost_amount", "currency_code"],
+        ),
         Index("idx_service_cost_fetched_at", "fetched_at"),
     )
 
@@ -128,10 +143,20 @@ class ServiceCost(SQLModel, table=True):
     cost_amount: Decimal = Field(
         sa_column=Column(DECIMAL(15, 2), nullable=False),
     )
-    fetched_at: datetime = Field(default_factory=_utcnow)
-    created_at: datetime = Field(default_factory=_utcnow)
-    updated_at: datetime = Field(
-        default_factory=_utcnow, sa_column_kwargs={"onupdate": _utcnow}
+    # Timestamps are filled in by PostgreSQL, not per-row in Python
+    fetched_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=func.now()),
+    )
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=func.now()),
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(), nullable=False, server_default=func.now(), onupdate=func.now()
+        ),
     )
 
     # relationships
@@ -231,7 +256,13 @@ class DailyCost(SQLModel, table=True):
         CheckConstraint("cost_amount >= 0", name="ck_daily_cost_amount_positive"),
         CheckConstraint("LENGTH(currency_code) = 3", name="ck_currency_code_length"),
         Index("idx_daily_cost_usage_date", "usage_date", postgresql_using="btree"),
-        Index("idx_daily_cost_billing_period", "billing_period_id"),
+        # Covering index: per-period date-range scans are served index-only
+        Index(
+            "idx_daily_cost_period_date",
+            "billing_period_id",
+            "usage_date",
+            postgresql_include=["cost_amount", "currency_code"],
+        ),
         Index("idx_daily_cost_service_date", "service_id", "usage_date"),
     )
 
@@ -256,10 +287,20 @@ class DailyCost(SQLModel, table=True):
     cost_amount: Decimal = Field(
         sa_column=Column(DECIMAL(15, 2), nullable=False),
     )
-    fetched_at: datetime = Field(default_factory=_utcnow)
-    created_at: datetime = Field(default_factory=_utcnow)
-    updated_at: datetime = Field(
-        default_factory=_utcnow, sa_column_kwargs={"onupdate": _utcnow}
+    # Timestamps are filled in by PostgreSQL, not per-row in Python
+    fetched_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=func.now()),
+    )
+    created_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(DateTime(), nullable=False, server_default=func.now()),
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(), nullable=False, server_default=func.now(), onupdate=func.now()
+        ),
     )
 
     # relationships
@@ -303,7 +344,7 @@ class AlertThreshold(SQLModel, table=True):
         sa_column=Column(DateTime(timezone=True)), default_factory=_utcnow
     )
     updated_at: datetime = Field(
-        default_factory=_utcnow, sa_column_kwargs={"onupdate": _utcnow}
+        default_factory=_utcnow, sa_column_kwargs={"onupdate": func.now()}
     )
 
     # relationships
@@ -448,7 +489,7 @@ class AnomalySettings(SQLModel, table=True):
         ),
     )
     updated_at: datetime = Field(
-        default_factory=_utcnow, sa_column_kwargs={"onupdate": _utcnow}
+        default_factory=_utcnow, sa_column_kwargs={"onupdate": func.now()}
     )
     receiver_email: str | None = Field(
         default=None,
@@ -460,3 +501,8 @@ class AnomalySettings(SQLModel, table=True):
         sa_column=Column(Boolean, nullable=False, default=False),
         description="Whether email notifications are enabled.",
     )
+
+
+# Resolve relationships and instrument all mapped classes at import time,
+# so the first request doesn't pay the one-off mapper configuration cost.
+configure_mappers()
@@ -1,16 +1,26 @@
-from datetime import date, datetime
+import asyncio
+from datetime import date, datetime, timezone
 from decimal import Decimal
+from itertools import batched
+from typing import Any
 
 from config import settings
+from db.database import engine
 from db.models import AzureService, BillingPeriod, DailyCost, ServiceCost
+from exceptions.cost_exceptions import DataProcessingError
 from loguru import logger
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlmodel import col, select, update
+from sqlmodel import SQLModel, col, func, or_, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from models.cost_models import CostRecord, CostRecordRead, DailyCostRecord
 
 
+# Max rows per multi-row INSERT ... ON CONFLICT statement
+BULK_CHUNK_SIZE: int = 1000
+
+
 async def get_or_create_billing_period(
     session: AsyncSession, start_date: datetime, end_date: datetime
 ) -> BillingPeriod:
@@ -18,66 +28,53 @@ async def get_or_create_billing_period(
     Get or create a billing period for the given date range.
 
     This function:
-    1. Checks if a billing period exists for the given start/end dates
-    2. If found, ensures it's marked as current
-    3. If not found, creates a new period and marks it as current
-    4. Automatically sets the previous current period to is_current=False
+    1. Unmarks any other period currently flagged is_current
+    2. Upserts the period for the given start/end dates with is_current=True
+       (INSERT ... ON CONFLICT on uq_billing_period_dates), returning the row
+
+    Two statements and one commit, instead of a SELECT followed by separate
+    UPDATE/INSERT and refresh round-trips. The unmark runs first so the
+    partial unique index on is_current never sees two current rows.
     """
     try:
-        # Check if billing period already exists for these dates
-        statement = select(BillingPeriod).where(
-            BillingPeriod.start_date == start_date, BillingPeriod.end_date == end_date
+        await session.exec(
+            update(BillingPeriod)
+            .where(
+                col(BillingPeriod.is_current).is_(True),
+                or_(
+                    BillingPeriod.start_date != start_date,
+                    BillingPeriod.end_date != end_date,
+                ),
+            )
+            .values(is_current=False)
+            # Nothing in this session holds BillingPeriod rows to keep in sync
+            .execution_options(synchronize_session=False)
         )
-        result = await session.exec(statement)
-        existing_period = result.first()
-
-        if existing_period:
-            # Period exists - ensure it's marked as current if it's not already
-            if not existing_period.is_current:
-                # Unmark the old current period
-                update_stmt = (
-                    update(BillingPeriod)
-                    .where(col(BillingPeriod.is_current).is_(True))
-                    .values(is_current=False)
-                )
-                await session.exec(update_stmt)
-
-                # Mark this period as current
-                existing_period.is_current = True
-                session.add(existing_period)
-                await session.commit()
-                await session.refresh(existing_period)
 
-            return existing_period
-
-        else:
-            # Period doesn't exist - create new one
-            # First, unmark any existing current period
-            update_stmt = (
-                update(BillingPeriod)
-                .where(col(BillingPeriod.is_current).is_(True))
-                .values(is_current=False)
+        upsert_stmt = (
+            pg_insert(BillingPeriod)
+            .values(
+                start_date=start_date,
+                end_date=end_date,
+                is_current=True,
+                created_at=datetime.now(timezone.utc),
             )
-            await session.exec(update_stmt)
-
-            # Create new period with is_current=True
-            new_period = BillingPeriod(
-                start_date=start_date, end_date=end_date, is_current=True
+            .on_conflict_do_update(
+                constraint="uq_billing_period_dates",
+                set_={"is_current": True},
             )
-            session.add(new_period)
-            await session.commit()
-            await session.refresh(new_period)
+            .returning(BillingPeriod)
+        )
+        result = await session.exec(upsert_stmt)
+        period = result.scalars().one()
+        await session.commit()
 
-            return new_period
+        return period
 
     except SQLAlchemyError as e:
         await session.rollback()
-        if settings.show_debug_info:
-            logger.error(f"Database error while managing billing period: {e}")
-            raise Exception(f"Database error while managing billing period: {str(e)}")
-        else:
-            logger.error("Database error while managing billing period")
-            raise Exception("Database error while managing billing period")
+        logger.opt(exception=True).error("Database error while managing billing period")
+        raise DataProcessingError("Database error while managing billing period") from e
 
 
 async def get_or_create_azure_service(
@@ -91,7 +88,6 @@ async def get_or_create_azure_service(
     if service:
         if service_category and service.service_category != service_category:
             service.service_category = service_category
-            session.add(service)
             await session.flush()
         return service
 
@@ -101,6 +97,94 @@ async def get_or_create_azure_service(
     return service
 
 
+async def prefetch_service_ids(
+    session: AsyncSession, services: dict[str, str | None]
+) -> dict[str, int]:
+    """
+    Resolve AzureService ids for a whole batch of service names.
+
+    Args:
+        services: Mapping of service name -> service category (or None)
+
+    Returns:
+        dict[str, int]: Mapping of service name -> AzureService.id
+
+    Issues one SELECT for the known names, then a single
+    INSERT ... ON CONFLICT for names that are missing or whose category
+    changed, instead of one get_or_create_azure_service() call per record.
+    """
+    if not services:
+        return {}
+
+    result = await session.exec(
+        select(AzureService.id, AzureService.name, AzureService.service_category).where(
+            col(AzureService.name).in_(services.keys())
+        )
+    )
+    now = datetime.now(timezone.utc)
+    service_ids: dict[str, int] = {}
+    to_write: list[dict[str, Any]] = []
+    for service_id, name, category in result.all():
+        service_ids[name] = service_id
+        new_category = services[name]
+        if new_category and new_category != category:
+            # Same keys as new rows so the multi-row VALUES has one column
+            # list; set_ below never overwrites an existing created_at
+            to_write.append(
+                {"name": name, "service_category": new_category, "created_at": now}
+            )
+
+    to_write.extend(
+        {"name": name, "service_category": category, "created_at": now}
+        for name, category in services.items()
+        if name not in service_ids
+    )
+
+    if to_write:
+        # Lock rows in a stable order so concurrent daily/service saves
+        # touching overlapping names cannot deadlock each other
+        to_write.sort(key=lambda row: row["name"])
+        stmt = pg_insert(AzureService).values(to_write)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "service_category": func.coalesce(
+                    stmt.excluded.service_category, AzureService.service_category
+                )
+            },
+        ).returning(AzureService.id, AzureService.name)
+        result = await session.exec(stmt)
+        service_ids.update({name: service_id for service_id, name in result.all()})
+
+    return service_ids
+
+
+def _upsert_cost_stmt(model: type[SQLModel], constraint: str) -> Any:
+    """
+    Build an INSERT ... ON CONFLICT for a cost table that refreshes the amount,
+    currency and timestamps of an existing row with the same natural key.
+    Values are supplied as execution parameters.
+    """
+    stmt = pg_insert(model)
+    return stmt.on_conflict_do_update(
+        constraint=constraint,
+        set_={
+            "cost_amount": stmt.excluded.cost_amount,
+            "currency_code": stmt.excluded.currency_code,
+            "fetched_at": func.now(),
+            "updated_at": func.now(),
+        },
+    )
+
+
+# Built once at import and executed with bound parameters, so the hot paths
+# skip rebuilding the expression tree and hit SQLAlchemy's compiled cache
+_SERVICE_COST_UPSERT = _upsert_cost_stmt(ServiceCost, "uq_service_cost_natural_key")
+_DAILY_COST_UPSERT = _upsert_cost_stmt(DailyCost, "uq_daily_cost_date_service_period")
+_SERVICE_COST_UPSERT_RETURNING = _SERVICE_COST_UPSERT.returning(ServiceCost)
+_DAILY_COST_UPSERT_RETURNING = _DAILY_COST_UPSERT.returning(DailyCost)
+
+
 async def upsert_service_cost(
     session: AsyncSession,
     service_id: int | None,
@@ -109,27 +193,17 @@ async def upsert_service_cost(
     currency_code: str,
 ) -> ServiceCost:
     """Insert or update a service cost record."""
-    statement = select(ServiceCost).where(
-        ServiceCost.service_id == service_id,
-        ServiceCost.billing_period_id == billing_period_id,
-    )
-    result = await session.exec(statement)
-    existing = result.first()
-
-    if existing:
-        existing.cost_amount = cost_amount
-        existing.currency_code = currency_code
-        session.add(existing)
-        return existing
-
-    record = ServiceCost(
-        service_id=service_id,
-        billing_period_id=billing_period_id,
-        cost_amount=cost_amount,
-        currency_code=currency_code,
+    result = await session.exec(
+        _SERVICE_COST_UPSERT_RETURNING,
+        params={
+            "service_id": service_id,
+            "billing_period_id": billing_period_id,
+            "cost_amount": cost_amount,
+            "currency_code": currency_code,
+        },
+        execution_options={"populate_existing": True},
     )
-    session.add(record)
-    return record
+    return result.scalars().one()
 
 
 async def upsert_daily_cost(
@@ -141,29 +215,64 @@ async def upsert_daily_cost(
     currency_code: str,
 ) -> DailyCost:
     """Insert or update a daily cost record."""
-    statement = select(DailyCost).where(
-        DailyCost.usage_date == usage_date,
-        DailyCost.service_id == service_id,
-        DailyCost.billing_period_id == billing_period_id,
-    )
-    result = await session.exec(statement)
-    existing = result.first()
-
-    if existing:
-        existing.cost_amount = cost_amount
-        existing.currency_code = currency_code
-        session.add(existing)
-        return existing
-
-    record = DailyCost(
-        service_id=service_id,
-        billing_period_id=billing_period_id,
-        usage_date=usage_date,
-        cost_amount=cost_amount,
-        currency_code=currency_code,
+    result = await session.exec(
+        _DAILY_COST_UPSERT_RETURNING,
+        params={
+            "service_id": service_id,
+            "billing_period_id": billing_period_id,
+            "usage_date": usage_date,
+            "cost_amount": cost_amount,
+            "currency_code": currency_code,
+        },
+        execution_options={"populate_existing": True},
     )
-    session.add(record)
-    return record
+    return result.scalars().one()
+
+
+async def _upsert_chunk(
+    stmt: Any, rows: tuple[dict[str, Any], ...], sem: asyncio.Semaphore
+) -> None:
+    """Upsert one chunk in its own pooled connection and transaction."""
+    async with sem, engine.begin() as conn:
+        await conn.execute(stmt, list(rows))
+
+
+async def _bulk_upsert_costs(
+    session: AsyncSession,
+    stmt: Any,
+    rows: list[dict[str, Any]],
+) -> None:
+    """
+    Upsert cost rows with one INSERT ... ON CONFLICT DO UPDATE per chunk of
+    BULK_CHUNK_SIZE rows, refreshing the amount, currency and timestamps of
+    rows that already exist.
+
+    A single chunk runs in the caller's session. Larger payloads commit the
+    session first (so upserted services are visible to other connections),
+    then upsert the chunks concurrently, each in its own connection and
+    transaction, capped at half the pool. The first failure cancels the
+    chunks still pending or in flight; chunks that already committed stay
+    committed.
+    """
+    chunks = list(batched(rows, BULK_CHUNK_SIZE))
+    if len(chunks) <= 1:
+        # Executed with a parameter list so SQLAlchemy's insertmanyvalues path
+        # batches the rows into multi-row VALUES from one cached statement.
+        if chunks:
+            await session.exec(stmt, params=list(chunks[0]))
+        await session.commit()
+        return
+
+    await session.commit()
+    session.expunge_all()
+    sem = asyncio.Semaphore(max(1, settings.DB_POOL_SIZE // 2))
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for chunk in chunks:
+                tg.create_task(_upsert_chunk(stmt, chunk, sem))
+    except ExceptionGroup as eg:
+        # Surface the chunk failure itself so callers' except clauses match
+        raise eg.exceptions[0] from eg
 
 
 async def save_service_costs(
@@ -174,34 +283,34 @@ async def save_service_costs(
     """Save preprocessed CostRecords to the database. Returns count saved."""
     saved = 0
     try:
+        service_ids = await prefetch_service_ids(
+            session, {r.service_name: r.service_category for r in records}
+        )
+        # Keyed by the natural key so duplicates collapse (last one wins),
+        # as ON CONFLICT cannot touch the same row twice in one statement
+        rows: dict[int, dict[str, Any]] = {}
         for record in records:
-            service = await get_or_create_azure_service(
-                session, record.service_name, getattr(record, "service_category", None)
-            )
-            await upsert_service_cost(
-                session=session,
-                service_id=service.id,
-                billing_period_id=billing_period_id,
-                cost_amount=record.cost,
-                currency_code=record.currency,
-            )
+            service_id = service_ids[record.service_name]
+            rows[service_id] = {
+                "service_id": service_id,
+                "billing_period_id": billing_period_id,
+                "cost_amount": record.cost,
+                "currency_code": record.currency,
+            }
             saved += 1
 
-        await session.commit()
+        await _bulk_upsert_costs(session, _SERVICE_COST_UPSERT, list(rows.values()))
+
         if settings.show_debug_info:
-            logger.info(f"Saved {saved} service cost records to database")
+            logger.info("Saved {} service cost records to database", saved)
         else:
             logger.info("Service cost records saved to database")
         return saved
 
     except SQLAlchemyError as e:
         await session.rollback()
-        if settings.show_debug_info:
-            logger.error(f"Failed to save service costs: {e}")
-            raise Exception(f"Database error while saving service costs: {str(e)}")
-        else:
-            logger.error("Failed to save service costs")
-            raise Exception("Database error while saving service costs")
+        logger.opt(exception=True).error("Failed to save service costs")
+        raise DataProcessingError("Database error while saving service costs") from e
 
 
 async def save_daily_costs(
@@ -212,35 +321,36 @@ async def save_daily_costs(
     """Save preprocessed DailyCostRecords to the database. Returns count saved."""
     saved = 0
     try:
+        service_ids = await prefetch_service_ids(
+            session, {r.service_name: r.service_category for r in records}
+        )
+        # Keyed by the natural key so duplicates collapse (last one wins),
+        # as ON CONFLICT cannot touch the same row twice in one statement
+        rows: dict[tuple[date, int], dict[str, Any]] = {}
         for record in records:
-            service = await get_or_create_azure_service(
-                session, record.service_name, getattr(record, "service_category", None)
-            )
-            await upsert_daily_cost(
-                session=session,
-                service_id=service.id,
-                billing_period_id=billing_period_id,
-                usage_date=record.usage_date,
-                cost_amount=record.cost,
-                currency_code=record.currency,
-            )
+            service_id = service_ids[record.service_name]
+            usage_date = record.usage_date.date()
+            rows[(usage_date, service_id)] = {
+                "service_id": service_id,
+                "billing_period_id": billing_period_id,
+                "usage_date": usage_date,
+                "cost_amount": record.cost,
+                "currency_code": record.currency,
+            }
             saved += 1
 
-        await session.commit()
+        await _bulk_upsert_costs(session, _DAILY_COST_UPSERT, list(rows.values()))
+
         if settings.show_debug_info:
-            logger.info(f"Saved {saved} daily cost records to database")
+            logger.info("Saved {} daily cost records to database", saved)
         else:
             logger.info("Daily cost records saved to database")
         return saved
 
     except SQLAlchemyError as e:
         await session.rollback()
-        if settings.show_debug_info:
-            logger.error(f"Failed to save daily costs: {e}")
-            raise Exception(f"Database error while saving daily costs: {str(e)}")
-        else:
-            logger.error("Failed to save daily costs")
-            raise Exception("Database error while saving daily costs")
+        logger.opt(exception=True).error("Failed to save daily costs")
+        raise DataProcessingError("Database error while saving daily costs") from e
 
 
 async def get_daily_costs_by_range(
@@ -290,14 +400,10 @@ async def get_daily_costs_by_range(
         ]
 
     except SQLAlchemyError as e:
-        if settings.show_debug_info:
-            logger.error(
-                f"Failed to fetch daily costs for range {start_date} – {end_date}: {e}"
-            )
-            raise Exception(f"Database error while fetching daily costs: {str(e)}")
-        else:
-            logger.error("Failed to fetch daily costs")
-            raise Exception("Database error while fetching daily costs")
+        logger.opt(exception=True).error(
+            "Failed to fetch daily costs for range {} – {}", start_date, end_date
+        )
+        raise DataProcessingError("Database error while fetching daily costs") from e
 
 
 async def get_monthly_costs_by_range(
@@ -352,11 +458,7 @@ async def get_monthly_costs_by_range(
         ]
 
     except SQLAlchemyError as e:
-        if settings.show_debug_info:
-            logger.error(
-                f"Failed to fetch monthly costs for range {start_date} – {end_date}: {e}"
-            )
-            raise Exception(f"Database error while fetching monthly costs: {str(e)}")
-        else:
-            logger.error("Failed to fetch monthly costs")
-            raise Exception("Database error while fetching monthly costs")
+        logger.opt(exception=True).error(
+            "Failed to fetch monthly costs for range {} – {}", start_date, end_date
+        )
+        raise DataProcessingError("Database error while fetching monthly costs") from e
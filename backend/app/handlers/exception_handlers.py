@@ -11,7 +11,7 @@ from config import settings
 
 
 async def azure_api_error_handler(request: Request, exc: AzureApiError):
-    logger.error(f"Azure API error: {exc}")
+    logger.error("Azure API error: {}", exc)
     return create_error_response(
         status_code=502,
         message="Azure API error occurred" if settings.is_production else str(exc),
@@ -21,7 +21,7 @@ async def azure_api_error_handler(request: Request, exc: AzureApiError):
 
 
 async def data_processing_error_handler(request: Request, exc: DataProcessingError):
-    logger.error(f"Data processing error: {exc}")
+    logger.error("Data processing error: {}", exc)
     return create_error_response(
         status_code=500,
         message="Data processing error" if settings.is_production else str(exc),
@@ -31,7 +31,7 @@ async def data_processing_error_handler(request: Request, exc: DataProcessingErr
 
 
 async def data_validation_error_handler(request: Request, exc: DataValidationError):
-    logger.error(f"Data validation error: {exc}")
+    logger.error("Data validation error: {}", exc)
     return create_error_response(
         status_code=422,
         message="Data validation error" if settings.is_production else str(exc),
@@ -41,7 +41,7 @@ async def data_validation_error_handler(request: Request, exc: DataValidationErr
 
 
 async def alert_error_handler(request: Request, exc: AlertError):
-    logger.error(f"Alert system error: {exc}")
+    logger.error("Alert system error: {}", exc)
     return create_error_response(
         status_code=500,
         message="Alert system error" if settings.is_production else str(exc),
@@ -51,7 +51,7 @@ async def alert_error_handler(request: Request, exc: AlertError):
 
 
 async def generic_error_handler(request: Request, exc: Exception):
-    logger.exception(f"Unexpected error: {exc}")
+    logger.opt(exception=exc).error("Unexpected error: {}", exc)
     return create_error_response(
         status_code=500,
         message="An unexpected error occurred",
@@ -1,22 +1,25 @@
+import asyncio
+import time
 from contextlib import asynccontextmanager
 
 
 import uvicorn
 from config import settings
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from typing import Any, cast
 from fastapi.middleware.cors import CORSMiddleware
 
 from loguru import logger
+from sqlalchemy import text
 from routes.cost_routes import router as cost_router
 from routes.alert_routes import router as alert_router
-from services.cost_service import shutdown_executor
 from services.email_service import shutdown_email_executor
 from db.alert_operations import seed_anomaly_settings
-from db.database import init_db, close_db, get_session_context
+from db.database import engine, init_db, close_db, get_session_context, warmup_pool
 
 from handlers.exception_handlers import register_exception_handlers
+from utils.middleware import SelectiveGZipMiddleware
 
 from scheduler import (
     get_scheduler_status,
@@ -35,6 +38,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Azure Cost Analyzer API...")
     logger.info("Initializing database connection...")
     await init_db()
+    await warmup_pool()
     logger.info("Database initialized successfully")
 
     logger.info("Seeding anomaly settings...")
@@ -62,7 +66,6 @@ async def lifespan(app: FastAPI):
     logger.info("Closing database connections...")
     await close_db()
     logger.info("Database connections closed")
-    shutdown_executor()
     shutdown_email_executor()
     logger.info("Cleanup complete")
 
@@ -86,6 +89,15 @@ app.add_middleware(
     allow_headers=settings.CORS_ALLOW_HEADERS,
 )
 
+# Cost payloads list every Azure service and compress well; the NDJSON
+# stream is left uncompressed so lines reach the client as they are produced
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    exclude_paths=("/cost/last-7-days/stream",),
+)
+
 # Register exception handlers
 register_exception_handlers(app)
 
@@ -116,16 +128,37 @@ async def home():
     return response
 
 
+# Cache the DB probe briefly so frequent liveness checks don't each take a
+# pool connection; the lock makes concurrent misses share a single probe.
+_HEALTH_TTL: float = 2.0
+_health_lock = asyncio.Lock()
+_last_health_check: tuple[float, str] = (float("-inf"), "unknown")
+
+
+async def _probe_database() -> str:
+    global _last_health_check
+
+    async with _health_lock:
+        checked_at, db_status = _last_health_check
+        if time.monotonic() - checked_at < _HEALTH_TTL:
+            return db_status
+
+        try:
+            async with get_session_context() as session:
+                await session.exec(text("SELECT 1"))
+            db_status = "connected"
+        except Exception:
+            db_status = "disconnected"
+
+        _last_health_check = (time.monotonic(), db_status)
+        return db_status
+
+
 @app.get("/health")
 async def health_check():
-    from sqlalchemy import text
-
-    try:
-        async with get_session_context() as session:
-            await session.exec(text("SELECT 1"))
-        db_status = "connected"
-    except Exception:
-        db_status = "disconnected"
+    checked_at, db_status = _last_health_check
+    if time.monotonic() - checked_at >= _HEALTH_TTL:
+        db_status = await _probe_database()
 
     response = {
         "status": "healthy" if db_status == "connected" else "degraded",
@@ -139,6 +172,17 @@ async def health_check():
     return response
 
 
+@app.get("/debug/pool", include_in_schema=False)
+async def pool_status():
+    """
+    Get database connection pool status. Only available in development.
+    """
+    if not settings.show_debug_info:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    return {"status": engine.pool.status()}
+
+
 @app.get("/status", tags=["scheduler"])
 async def scheduler_status():
     """
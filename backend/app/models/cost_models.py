@@ -4,13 +4,20 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
+_Q = Decimal("0.01")
+
 
 # Shared validators as standalone functions
 def validate_cost_amount(v: Any) -> Decimal:
     """Round cost to 2 decimal places"""
-    if isinstance(v, (int, float)):
-        return Decimal(str(v)).quantize(Decimal("0.01"))
-    return Decimal(v).quantize(Decimal("0.01"))
+    if isinstance(v, Decimal):
+        return v.quantize(_Q)
+    if isinstance(v, int):
+        return Decimal(v).quantize(_Q)
+    if isinstance(v, float):
+        # repr gives the shortest round-tripping form, avoiding binary noise
+        return Decimal(repr(v)).quantize(_Q)
+    return Decimal(v).quantize(_Q)
 
 
 def validate_currency_code(v: str) -> str:
@@ -18,6 +25,11 @@ def validate_currency_code(v: str) -> str:
     return v.upper()
 
 
+def validate_service_name_value(v: str) -> str:
+    """Store service names as-is from Azure"""
+    return v.strip() if v else "Unknown"
+
+
 class CostRecordRead(BaseModel):
     """
     Flat read projection returned by DB-backed endpoints.
@@ -42,9 +54,7 @@ class CostQueryResponse(BaseModel):
 class CostRecord(BaseModel):
     """Validated and preprocessed cost record"""
 
-    model_config = ConfigDict(
-        validate_assignment=True,
-    )
+    model_config = ConfigDict(frozen=True)
 
     service_name: str
     service_category: str | None = Field(default=None)
@@ -69,7 +79,7 @@ class CostRecord(BaseModel):
     @classmethod
     def validate_service_name(cls, v: str) -> str:
         """Store service names as-is from Azure"""
-        return v.strip() if v else "Unknown"
+        return validate_service_name_value(v)
 
     @field_validator("currency")
     @classmethod
@@ -82,13 +92,18 @@ class CostRecord(BaseModel):
         """Serialize Decimal to float for JSON"""
         return float(value)
 
+    @field_serializer(
+        "billing_period_start", "billing_period_end", "fetched_at", when_used="json"
+    )
+    def serialize_datetime(self, value: datetime) -> str:
+        """Serialize datetimes with isoformat() ("+00:00" rather than "Z")"""
+        return value.isoformat()
+
 
 class DailyCostRecord(BaseModel):
     """Cost record with daily granularity"""
 
-    model_config = ConfigDict(
-        validate_assignment=True,
-    )
+    model_config = ConfigDict(frozen=True)
 
     service_name: str
     service_category: str | None = Field(default=None)
@@ -109,7 +124,7 @@ class DailyCostRecord(BaseModel):
     @classmethod
     def validate_service_name(cls, v: str) -> str:
         """Store service names as-is from Azure"""
-        return v.strip() if v else "Unknown"
+        return validate_service_name_value(v)
 
     @field_validator("currency")
     @classmethod
@@ -121,3 +136,14 @@ class DailyCostRecord(BaseModel):
     def serialize_cost(self, value: Decimal) -> float:
         """Serialize Decimal to float for JSON"""
         return float(value)
+
+    @field_serializer(
+        "usage_date",
+        "billing_period_start",
+        "billing_period_end",
+        "fetched_at",
+        when_used="json",
+    )
+    def serialize_datetime(self, value: datetime) -> str:
+        """Serialize datetimes with isoformat() ("+00:00" rather than "Z")"""
+        return value.isoformat()
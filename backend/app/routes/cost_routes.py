@@ -1,6 +1,11 @@
+import hashlib
+from collections.abc import AsyncIterator, Iterable
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from config import settings
@@ -23,8 +28,31 @@ from services.cost_service import (
     fetch_month_to_date_cost_by_service,
 )
 from services.cost_tasks import fetch_process_save
+from utils.responses import PydanticJSONResponse
 
-router = APIRouter(prefix="/cost", tags=["cost"])
+router = APIRouter(
+    prefix="/cost", tags=["cost"], default_response_class=PydanticJSONResponse
+)
+
+
+async def _ndjson(records: Iterable[BaseModel]) -> AsyncIterator[bytes]:
+    """Yield each record as one line of newline-delimited JSON."""
+    for record in records:
+        yield to_json(record) + b"\n"
+
+
+def _etag(body: bytes) -> str:
+    """Weak ETag for a rendered body (cache_hit may differ between copies)."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already matches etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
 
 
 @router.get("/last-7-days")
@@ -33,13 +61,29 @@ async def get_last_7_days_cost():
     processed_records, billing_period_id, saved_count = await fetch_process_save(
         fetch_last_7_days_cost, preprocess_daily_costs, save_daily_costs
     )
-    return {
-        "status": "success",
-        "billing_period_id": billing_period_id,
-        "count": len(processed_records),
-        "saved_to_db": saved_count,
-        "data": [record.model_dump() for record in processed_records],
-    }
+    return PydanticJSONResponse(
+        {
+            "status": "success",
+            "billing_period_id": billing_period_id,
+            "count": len(processed_records),
+            "saved_to_db": saved_count,
+            "data": processed_records,
+        }
+    )
+
+
+@router.get("/last-7-days/stream")
+async def stream_last_7_days_cost():
+    """
+    Same as /last-7-days but streams the records as NDJSON, one per line,
+    so the body is never materialized as a single JSON array.
+    """
+    processed_records, _, _ = await fetch_process_save(
+        fetch_last_7_days_cost, preprocess_daily_costs, save_daily_costs
+    )
+    return StreamingResponse(
+        _ndjson(processed_records), media_type="application/x-ndjson"
+    )
 
 
 @router.get("/month-to-date")
@@ -50,13 +94,15 @@ async def get_month_to_date_cost_by_service():
         preprocess_service_costs,
         save_service_costs,
     )
-    return {
-        "status": "success",
-        "billing_period_id": billing_period_id,
-        "count": len(processed_records),
-        "saved_to_db": saved_count,
-        "data": [record.model_dump() for record in processed_records],
-    }
+    return PydanticJSONResponse(
+        {
+            "status": "success",
+            "billing_period_id": billing_period_id,
+            "count": len(processed_records),
+            "saved_to_db": saved_count,
+            "data": processed_records,
+        }
+    )
 
 
 @router.get("/month-to-date/raw")
@@ -64,11 +110,12 @@ async def get_month_to_date_cost_raw():
     """Raw month-to-date costs without preprocessing (debug)."""
     raw_result = await fetch_month_to_date_cost_by_service()
     data = normalize_cost_response(raw_result)
-    return {"status": "success", "data": data}
+    return PydanticJSONResponse({"status": "success", "data": data})
 
 
 @router.get("/db")
 async def get_cost_from_db(
+    request: Request,
     granularity: str = Query(
         default="daily",
         pattern="^(daily|monthly)$",
@@ -94,6 +141,8 @@ async def get_cost_from_db(
     any custom dates               -> used exactly as provided
 
     Response includes cache_hit: true when served from the in-process TTL cache.
+    Cached bodies are stored pre-rendered with an ETag; a matching
+    If-None-Match gets 304 Not Modified.
     """
     from loguru import logger
 
@@ -117,7 +166,10 @@ async def get_cost_from_db(
     # Cache lookup — return immediately on hit
     cached = cost_cache.get(cache_key)
     if cached is not None:
-        return cached
+        etag, body = cached
+        if _is_not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(body, media_type="application/json", headers={"ETag": etag})
 
     # DB query
     if granularity == "daily":
@@ -141,11 +193,13 @@ async def get_cost_from_db(
         "total_cost": total_cost,
         "currency": currency,
         "cache_hit": False,
-        "data": [r.model_dump() for r in records],
+        "data": records,
     }
 
-    # Store a version with cache_hit=True for subsequent requests
-    cost_cache.set(cache_key, {**response, "cache_hit": True}, ttl=ttl_for(granularity))
+    # Store a rendered version with cache_hit=True for subsequent requests
+    cached_body = to_json({**response, "cache_hit": True})
+    etag = _etag(cached_body)
+    cost_cache.set(cache_key, (etag, cached_body), ttl=ttl_for(granularity))
 
     if settings.show_debug_info:
         logger.debug(
@@ -154,4 +208,6 @@ async def get_cost_from_db(
             f"rows={len(records)}"
         )
 
-    return response
+    if _is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return PydanticJSONResponse(response, headers={"ETag": etag})
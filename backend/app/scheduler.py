@@ -1,4 +1,5 @@
-from datetime import datetime
+import time
+from datetime import UTC, datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -16,13 +17,17 @@ from services.cost_preprocessor import (
     preprocess_service_costs,
 )
 from services.cost_service import (
+    TOKEN_PREFETCH_MINUTES,
     fetch_last_7_days_cost,
     fetch_month_to_date_cost_by_service,
+    prefetch_azure_token,
 )
 from services.cost_tasks import fetch_process_save
 
 # Global scheduler instance
 scheduler: AsyncIOScheduler | None = None
+# Job fields that never change after create_scheduler, reused by status calls
+_jobs_static: list[dict] = []
 
 
 async def fetch_and_save_daily_costs() -> None:
@@ -30,7 +35,7 @@ async def fetch_and_save_daily_costs() -> None:
     Background job to fetch daily costs, save to database, then evaluate
     daily alert thresholds.
     """
-    job_start = datetime.now()
+    job_start = time.perf_counter()
     logger.info("Starting scheduled job: fetch_and_save_daily_costs")
 
     try:
@@ -38,14 +43,14 @@ async def fetch_and_save_daily_costs() -> None:
             fetch_last_7_days_cost, preprocess_daily_costs, save_daily_costs
         )
 
-        duration: int | float = (datetime.now() - job_start).total_seconds()
+        duration: float = time.perf_counter() - job_start
         logger.info(
             f"Completed scheduled job: fetch_and_save_daily_costs "
             f"({saved_count} records saved in {duration:.2f}s)"
         )
 
     except Exception as e:
-        duration: int | float = (datetime.now() - job_start).total_seconds()
+        duration: float = time.perf_counter() - job_start
         logger.error(
             f"Failed scheduled job: fetch_and_save_daily_costs "
             f"(duration: {duration:.2f}s, error: {e})"
@@ -70,7 +75,7 @@ async def fetch_and_save_service_costs() -> None:
     Background job to fetch month-to-date service costs, save to database,
     then evaluate monthly alert thresholds.
     """
-    job_start = datetime.now()
+    job_start = time.perf_counter()
     logger.info("Starting scheduled job: fetch_and_save_service_costs")
 
     try:
@@ -80,14 +85,14 @@ async def fetch_and_save_service_costs() -> None:
             save_service_costs,
         )
 
-        duration: int | float = (datetime.now() - job_start).total_seconds()
+        duration: float = time.perf_counter() - job_start
         logger.info(
             f"Completed scheduled job: fetch_and_save_service_costs "
             f"({saved_count} records saved in {duration:.2f}s)"
         )
 
     except Exception as e:
-        duration: int | float = (datetime.now() - job_start).total_seconds()
+        duration: float = time.perf_counter() - job_start
         logger.error(
             f"Failed scheduled job: fetch_and_save_service_costs "
             f"(duration: {duration:.2f}s, error: {e})"
@@ -107,6 +112,17 @@ async def fetch_and_save_service_costs() -> None:
         logger.error(f"Monthly alert evaluation failed (non-fatal): {exc}")
 
 
+async def refresh_azure_token() -> None:
+    """Background job to refresh the Azure access token before it expires."""
+    try:
+        await prefetch_azure_token()
+    except Exception as e:
+        if settings.show_debug_info:
+            logger.warning(f"Azure token prefetch failed (non-fatal): {e}")
+        else:
+            logger.warning("Azure token prefetch failed (non-fatal)")
+
+
 def create_scheduler() -> AsyncIOScheduler:
     """
     Create and configure the APScheduler instance.
@@ -114,6 +130,7 @@ def create_scheduler() -> AsyncIOScheduler:
     Schedule configuration:
     - Daily costs
     - Service costs
+    - Azure token refresh
 
     Returns:
         AsyncIOScheduler: Configured scheduler instance
@@ -144,6 +161,16 @@ def create_scheduler() -> AsyncIOScheduler:
         misfire_grace_time=1800,  # Allow 30 min delay if missed
     )
 
+    scheduler.add_job(
+        refresh_azure_token,
+        trigger=IntervalTrigger(minutes=TOKEN_PREFETCH_MINUTES),
+        id="refresh_azure_token",
+        name=f"Refresh Azure Token (Every {TOKEN_PREFETCH_MINUTES} minutes)",
+        replace_existing=True,
+        max_instances=1,
+        next_run_time=datetime.now(UTC),  # Also warm the token at startup
+    )
+
     logger.info("Scheduler configured with jobs:")
     logger.info(
         f"  - Daily costs: Every {settings.DAILY_COST_HOUR} hours and {settings.DAILY_COST_MINUTE} minutes"
@@ -151,6 +178,16 @@ def create_scheduler() -> AsyncIOScheduler:
     logger.info(
         f"  - Service costs: Every {settings.SERVICE_COST_HOUR} hours and {settings.SERVICE_COST_MINUTE} minutes"
     )
+    logger.info(f"  - Azure token refresh: Every {TOKEN_PREFETCH_MINUTES} minutes")
+
+    _jobs_static[:] = [
+        {
+            "id": job.id,
+            "name": job.name,
+            "trigger": str(job.trigger) if settings.is_development else None,
+        }
+        for job in scheduler.get_jobs()
+    ]
 
     return scheduler
 
@@ -204,16 +241,23 @@ def get_scheduler_status() -> dict:
     if scheduler is None:
         return {"status": "stopped", "jobs": []}
 
+    # Only next_run_time changes between calls, and it is only exposed in
+    # development, so production status checks never touch the job store.
+    next_runs = (
+        {job.id: job.next_run_time for job in scheduler.get_jobs()}
+        if settings.is_development
+        else {}
+    )
+
     jobs_info = []
-    for job in scheduler.get_jobs():
+    for job in _jobs_static:
+        next_run_time = next_runs.get(job["id"])
         jobs_info.append(
             {
-                "id": job.id,
-                "name": job.name,
-                "next_run": job.next_run_time.isoformat()
-                if (settings.is_development and job.next_run_time)
-                else None,
-                "trigger": str(job.trigger) if settings.is_development else None,
+                "id": job["id"],
+                "name": job["name"],
+                "next_run": next_run_time.isoformat() if next_run_time else None,
+                "trigger": job["trigger"],
             }
         )
 
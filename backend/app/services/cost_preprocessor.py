@@ -1,4 +1,6 @@
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from collections.abc import Iterable, Iterator
 from typing import List
 
 from exceptions.cost_exceptions import (
@@ -6,32 +8,46 @@ from exceptions.cost_exceptions import (
     DataValidationError,
 )
 from loguru import logger
-from models.cost_models import CostRecord, DailyCostRecord
+from models.cost_models import (
+    CostRecord,
+    DailyCostRecord,
+    validate_cost_amount,
+    validate_currency_code,
+    validate_service_name_value,
+)
 
 
-def normalize_cost_response(result):
+def _non_negative_cost(v) -> Decimal:
+    """Apply the cost field's rounding and ge=0 constraint outside Pydantic."""
+    cost = validate_cost_amount(v)
+    if cost < 0:
+        raise ValueError(f"Cost must be non-negative, got {cost}")
+    return cost
+
+
+def iter_cost_rows(result) -> Iterator[dict]:
     """
-    Transforms the Azure Cost Management query result into a list of dictionaries.
+    Lazily yields each row of an Azure Cost Management query result as a dict.
+
+    Lets preprocessing consume rows in a single pass without materializing an
+    intermediate list. Errors surface while iterating.
 
     Args:
         result: QueryResult from Azure Cost Management API.
 
-    Returns:
-        list[dict]: List of dictionaries where each dict represents a row with column names as keys.
+    Yields:
+        dict: One row with column names as keys.
 
     Raises:
         DataProcessingError: When response normalization fails.
     """
     try:
         # Extract column names from the result metadata
-        columns: list[str] = [col.name for col in result.columns]
-        data: list[dict[str, int | str]] = []
+        columns: tuple[str, ...] = tuple(col.name for col in result.columns)
 
         # Map each row to a dictionary using column names as keys
         for row in result.rows:
-            data.append(dict(zip(columns, row)))
-
-        return data
+            yield dict(zip(columns, row))
     except AttributeError as e:
         logger.error(f"Invalid response structure: {e}")
         raise DataProcessingError("Failed to parse cost response")
@@ -40,8 +56,24 @@ def normalize_cost_response(result):
         raise DataProcessingError("Failed to process cost data")
 
 
+def normalize_cost_response(result):
+    """
+    Transforms the Azure Cost Management query result into a list of dictionaries.
+
+    Args:
+        result: QueryResult from Azure Cost Management API.
+
+    Returns:
+        list[dict]: List of dictionaries where each dict represents a row with column names as keys.
+
+    Raises:
+        DataProcessingError: When response normalization fails.
+    """
+    return list(iter_cost_rows(result))
+
+
 def preprocess_service_costs(
-    raw_costs: List[dict],
+    raw_costs: Iterable[dict],
     billing_period_start: datetime,
     billing_period_end: datetime,
 ) -> List[CostRecord]:
@@ -49,7 +81,7 @@ def preprocess_service_costs(
     Preprocess raw Azure cost data into validated CostRecord objects.
 
     Args:
-        raw_costs: List of normalized cost dictionaries from Azure API
+        raw_costs: Normalized cost dictionaries from Azure API (any iterable)
         billing_period_start: Start of the billing period
         billing_period_end: End of the billing period
 
@@ -59,27 +91,37 @@ def preprocess_service_costs(
     Raises:
         DataValidationError: When all records fail validation.
     """
+    # Fields come from our own normalized dicts, so records are built with
+    # model_construct and only the model's validators are applied explicitly
     processed_records = []
     validation_errors = []
+    # One timestamp for the whole batch instead of one per record
+    fetched_at = datetime.now(timezone.utc)
+
+    # Hot-loop method lookups bound to locals once per batch
+    construct = CostRecord.model_construct
+    append = processed_records.append
 
     for raw_cost in raw_costs:
+        get = raw_cost.get
         try:
-            record = CostRecord(
-                service_name=raw_cost.get("ServiceName", "Unknown"),
-                service_category=raw_cost.get("ServiceFamily"),
-                cost=raw_cost.get("Cost", 0),
-                currency=raw_cost.get("Currency", "INR"),
+            record = construct(
+                service_name=validate_service_name_value(get("ServiceName", "Unknown")),
+                service_category=get("ServiceFamily"),
+                cost=_non_negative_cost(get("Cost", 0)),
+                currency=validate_currency_code(get("Currency", "INR")),
                 billing_period_start=billing_period_start,
                 billing_period_end=billing_period_end,
+                fetched_at=fetched_at,
             )
-            processed_records.append(record)
-        except (ValueError, TypeError) as e:
+            append(record)
+        except (ValueError, TypeError, AttributeError, ArithmeticError) as e:
             logger.warning(f"Validation error for cost record: {e}")
             validation_errors.append(str(e))
             continue
 
-    if not processed_records and raw_costs:
-        logger.error(f"All {len(raw_costs)} records failed validation")
+    if not processed_records and validation_errors:
+        logger.error(f"All {len(validation_errors)} records failed validation")
         raise DataValidationError("Failed to validate cost records")
 
     if validation_errors:
@@ -89,7 +131,7 @@ def preprocess_service_costs(
 
 
 def preprocess_daily_costs(
-    raw_costs: List[dict],
+    raw_costs: Iterable[dict],
     billing_period_start: datetime,
     billing_period_end: datetime,
 ) -> List[DailyCostRecord]:
@@ -97,7 +139,7 @@ def preprocess_daily_costs(
     Preprocess raw Azure daily cost data into validated DailyCostRecord objects.
 
     Args:
-        raw_costs: List of normalized cost dictionaries from Azure API
+        raw_costs: Normalized cost dictionaries from Azure API (any iterable)
         billing_period_start: Start of the billing period
         billing_period_end: End of the billing period
 
@@ -107,32 +149,48 @@ def preprocess_daily_costs(
     Raises:
         DataValidationError: When all records fail validation.
     """
+    # Fields come from our own normalized dicts, so records are built with
+    # model_construct and only the model's validators are applied explicitly
     processed_records = []
     validation_errors = []
+    # One timestamp for the whole batch instead of one per record
+    fetched_at = datetime.now(timezone.utc)
+    # A window only spans a handful of distinct dates; parse each one once
+    usage_dates: dict[int, datetime] = {}
+
+    # Hot-loop method lookups bound to locals once per batch
+    construct = DailyCostRecord.model_construct
+    append = processed_records.append
 
     for raw_cost in raw_costs:
+        get = raw_cost.get
         try:
             # Azure returns UsageDate as integer in format YYYYMMDD
-            usage_date_int = raw_cost.get("UsageDate", 0)
-            usage_date = datetime.strptime(str(usage_date_int), "%Y%m%d")
-
-            record = DailyCostRecord(
+            usage_date_int = get("UsageDate", 0)
+            usage_date = usage_dates.get(usage_date_int)
+            if usage_date is None:
+                ymd = int(usage_date_int)
+                usage_date = datetime(ymd // 10000, ymd // 100 % 100, ymd % 100)
+                usage_dates[usage_date_int] = usage_date
+
+            record = construct(
                 usage_date=usage_date,
-                service_name=raw_cost.get("ServiceName", "Unknown"),
-                service_category=raw_cost.get("ServiceFamily"),
-                cost=raw_cost.get("Cost", 0),
-                currency=raw_cost.get("Currency", "INR"),
+                service_name=validate_service_name_value(get("ServiceName", "Unknown")),
+                service_category=get("ServiceFamily"),
+                cost=_non_negative_cost(get("Cost", 0)),
+                currency=validate_currency_code(get("Currency", "INR")),
                 billing_period_start=billing_period_start,
                 billing_period_end=billing_period_end,
+                fetched_at=fetched_at,
             )
-            processed_records.append(record)
-        except (ValueError, TypeError) as e:
+            append(record)
+        except (ValueError, TypeError, AttributeError, ArithmeticError) as e:
             logger.warning(f"Validation error for daily cost record: {e}")
             validation_errors.append(str(e))
             continue
 
-    if not processed_records and raw_costs:
-        logger.error(f"All {len(raw_costs)} daily records failed validation")
+    if not processed_records and validation_errors:
+        logger.error(f"All {len(validation_errors)} daily records failed validation")
         raise DataValidationError("Failed to validate daily cost records")
 
     if validation_errors:
@@ -1,15 +1,16 @@
 import asyncio
 
-from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from functools import wraps
 from typing import Callable
 
+import anyio
 from azure.core.exceptions import (
     AzureError,
     ClientAuthenticationError,
     HttpResponseError,
 )
+from azure.auth import ARM_SCOPE, TOKEN_REFRESH_OFFSET, get_azure_credential
 from azure.cost_client import get_cost_client, subscription_scope
 from azure.mgmt.costmanagement.models import (
     QueryAggregation,
@@ -20,14 +21,38 @@ from azure.mgmt.costmanagement.models import (
 )
 from exceptions.cost_exceptions import AzureApiError
 from loguru import logger
-
-_executor = ThreadPoolExecutor(max_workers=4)
-
-
-def _shutdown_executor() -> None:
-    logger.info("Shutting down ThreadPoolExecutor...")
-    _executor.shutdown(wait=True, cancel_futures=False)
-    logger.info("ThreadPoolExecutor shutdown complete")
+from services.cache_service import TTLCache
+
+# Azure query results are reused for a few minutes; routes and scheduled jobs
+# often ask for the same data within seconds of each other
+AZURE_QUERY_TTL: int = 5 * 60
+_azure_cache = TTLCache()
+_inflight: dict[str, asyncio.Future] = {}
+
+# How often the ARM token is refreshed ahead of expiry in the background
+TOKEN_PREFETCH_MINUTES: int = 30
+
+# Date-independent query pieces, built once
+_MIDNIGHT_UTC = datetime.min.time().replace(tzinfo=timezone.utc)
+_COST_AGGREGATION = {"totalCost": QueryAggregation(name="Cost", function="Sum")}
+_SERVICE_GROUPING = [
+    QueryGrouping(type="Dimension", name="ServiceName"),
+    QueryGrouping(type="Dimension", name="ServiceFamily"),
+]
+_DAILY_DATASET = QueryDataset(
+    granularity="Daily",
+    aggregation=_COST_AGGREGATION,
+    grouping=_SERVICE_GROUPING,
+)
+_MTD_QUERY = QueryDefinition(
+    type="ActualCost",
+    timeframe="MonthToDate",
+    dataset=QueryDataset(
+        granularity="None",
+        aggregation=_COST_AGGREGATION,
+        grouping=_SERVICE_GROUPING,
+    ),
+)
 
 
 def handle_azure_exceptions(func: Callable) -> Callable:
@@ -50,6 +75,38 @@ def handle_azure_exceptions(func: Callable) -> Callable:
     return wrapper
 
 
+def cache_azure_query(func: Callable) -> Callable:
+    """
+    Decorator to cache an Azure query's result for AZURE_QUERY_TTL, keyed by
+    query and day. Concurrent misses share a single in-flight call; failures
+    are not cached.
+    """
+
+    @wraps(func)
+    async def wrapper():
+        key = f"{func.__name__}:{date.today().isoformat()}"
+        cached = _azure_cache.get(key)
+        if cached is not None:
+            return cached
+
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            _inflight[key] = task
+
+            def _on_done(t: asyncio.Future) -> None:
+                _inflight.pop(key, None)
+                if not t.cancelled() and t.exception() is None:
+                    _azure_cache.set(key, t.result(), ttl=AZURE_QUERY_TTL)
+
+            task.add_done_callback(_on_done)
+
+        # Shielded so one caller being cancelled doesn't fail the others
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
 def _fetch_last_7_days_cost_sync():
     client = get_cost_client()
     scope: str = subscription_scope()
@@ -61,65 +118,48 @@ def _fetch_last_7_days_cost_sync():
         type="ActualCost",
         timeframe="Custom",
         time_period=QueryTimePeriod(
-            from_property=datetime.combine(
-                last_week, datetime.min.time().replace(tzinfo=timezone.utc)
-            ),
-            to=datetime.combine(
-                today, datetime.min.time().replace(tzinfo=timezone.utc)
-            ),
-        ),
-        dataset=QueryDataset(
-            granularity="Daily",
-            aggregation={"totalCost": QueryAggregation(name="Cost", function="Sum")},
-            grouping=[
-                QueryGrouping(type="Dimension", name="ServiceName"),
-                QueryGrouping(type="Dimension", name="ServiceFamily"),
-            ],
+            from_property=datetime.combine(last_week, _MIDNIGHT_UTC),
+            to=datetime.combine(today, _MIDNIGHT_UTC),
         ),
+        dataset=_DAILY_DATASET,
     )
 
     return client.query.usage(scope=scope, parameters=query)
 
 
 @handle_azure_exceptions
+@cache_azure_query
 async def fetch_last_7_days_cost():
     """
     Asynchronously fetches the daily cost data for the last 7 days from Azure Cost Management.
     """
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(_executor, _fetch_last_7_days_cost_sync)
+    return await anyio.to_thread.run_sync(_fetch_last_7_days_cost_sync)
 
 
 def _fetch_month_to_date_cost_by_service_sync():
     client = get_cost_client()
     scope: str = subscription_scope()
 
-    query = QueryDefinition(
-        type="ActualCost",
-        timeframe="MonthToDate",
-        dataset=QueryDataset(
-            granularity="None",
-            aggregation={"totalCost": QueryAggregation(name="Cost", function="Sum")},
-            grouping=[
-                QueryGrouping(type="Dimension", name="ServiceName"),
-                QueryGrouping(type="Dimension", name="ServiceFamily"),
-            ],
-        ),
-    )
-
-    return client.query.usage(scope=scope, parameters=query)
+    return client.query.usage(scope=scope, parameters=_MTD_QUERY)
 
 
 @handle_azure_exceptions
+@cache_azure_query
 async def fetch_month_to_date_cost_by_service():
     """
     Asynchronously fetches the month-to-date cost data grouped by Azure service name.
     """
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(
-        _executor, _fetch_month_to_date_cost_by_service_sync
-    )
+    return await anyio.to_thread.run_sync(_fetch_month_to_date_cost_by_service_sync)
 
 
-def shutdown_executor() -> None:
-    _shutdown_executor()
+async def prefetch_azure_token() -> None:
+    """
+    Refresh the cached ARM access token if it would expire before the next
+    prefetch, so user requests never pay the AAD round trip.
+    """
+    credential = get_azure_credential()
+    await anyio.to_thread.run_sync(
+        lambda: credential.refresh_if_expiring(
+            ARM_SCOPE, within=TOKEN_PREFETCH_MINUTES * 60 + TOKEN_REFRESH_OFFSET
+        )
+    )
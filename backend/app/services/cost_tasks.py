@@ -1,3 +1,6 @@
+import asyncio
+from datetime import datetime
+
 from config import settings
 from db.database import get_session_context
 from db.operations import get_or_create_billing_period
@@ -6,48 +9,79 @@ from loguru import logger
 from services.cache_service import cost_cache
 from services.cost_preprocessor import (
     get_current_month_period,
-    normalize_cost_response,
+    iter_cost_rows,
 )
 
 
+async def _current_billing_period_id(
+    billing_start: datetime, billing_end: datetime
+) -> int | None:
+    """Upsert the current billing period in its own session and return its id."""
+    async with get_session_context() as session:
+        billing_period = await get_or_create_billing_period(
+            session, billing_start, billing_end
+        )
+        return billing_period.id
+
+
 async def fetch_process_save(fetch_func, preprocess_func, save_func):
     """
     Generic job to fetch, process, and save cost data.
 
+    The Azure fetch and the billing period upsert are independent I/O, so
+    they run concurrently before the records are preprocessed and saved.
+
     Returns:
         tuple: A tuple containing:
             - processed_records: The list or collection of processed cost records.
             - billing_period_id: The ID of the billing period associated with the records.
             - saved_count: The number of records successfully saved.
     """
-    processed_records = []
-    billing_period = None
-    saved_count = 0
     billing_start, billing_end = get_current_month_period()
 
+    raw_result, period_result = await asyncio.gather(
+        fetch_func(),
+        _current_billing_period_id(billing_start, billing_end),
+        return_exceptions=True,
+    )
+    if isinstance(raw_result, BaseException):
+        raise raw_result
+    period_failed = isinstance(period_result, BaseException)
+    billing_period_id = None if period_failed else period_result
+
     try:
-        raw_result = await fetch_func()
-        normalized_data = normalize_cost_response(raw_result)
-        processed_records = preprocess_func(normalized_data, billing_start, billing_end)
+        # Rows are normalized lazily and consumed by preprocessing in one pass
+        processed_records = preprocess_func(
+            iter_cost_rows(raw_result), billing_start, billing_end
+        )
     except DataProcessingError as e:
         if settings.show_debug_info:
             logger.error(f"Unable to process data: {e}")
         else:
             logger.error("Unable to process data")
+        return [], billing_period_id, 0
+
+    if period_failed:
+        if settings.show_debug_info:
+            logger.error(f"Error occured while saving data: {period_result}")
+        else:
+            logger.error("Error occured while saving data")
+        return processed_records, None, 0
+
+    if not processed_records:
+        return processed_records, billing_period_id, 0
 
     try:
         async with get_session_context() as session:
-            billing_period = await get_or_create_billing_period(
-                session, billing_start, billing_end
-            )
-            saved_count = await save_func(session, billing_period.id, processed_records)
+            saved_count = await save_func(session, billing_period_id, processed_records)
     except Exception as e:
         if settings.show_debug_info:
             logger.error(f"Error occured while saving data: {e}")
         else:
             logger.error("Error occured while saving data")
-
-    billing_period_id = billing_period.id if billing_period else None
+        # Chunks committed before the failure may have changed rows
+        cost_cache.clear()
+        return processed_records, billing_period_id, 0
 
     # Invalidate the in-process cache so the next /cost/db request
     # reflects the freshly saved data instead of stale cached rows.
@@ -0,0 +1,24 @@
+from typing import Any
+
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves the given request paths uncompressed.
+    Used for streaming routes, where the compressor would buffer chunks
+    and delay the first bytes reaching the client.
+    """
+
+    def __init__(
+        self, app: ASGIApp, *, exclude_paths: tuple[str, ...] = (), **kwargs: Any
+    ) -> None:
+        super().__init__(app, **kwargs)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
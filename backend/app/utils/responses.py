@@ -1,7 +1,25 @@
-from fastapi.responses import JSONResponse
 import traceback
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
 from config import settings
 
+# Max stack frames included in debug tracebacks; deep async stacks get truncated
+TRACEBACK_LIMIT: int = 20
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core in one pass.
+    Content may contain models, datetimes and Decimals directly, so routes
+    returning it skip FastAPI's jsonable_encoder and stdlib json.dumps.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
 
 def create_error_response(
     status_code: int,
@@ -16,10 +34,17 @@ def create_error_response(
     content = {"detail": message}
 
     if include_debug and settings.show_debug_info and exc:
+        tb = None
+        if settings.DEBUG:
+            tb = "".join(
+                traceback.format_exception(
+                    type(exc), exc, exc.__traceback__, limit=TRACEBACK_LIMIT
+                )
+            )
         content["debug"] = {
             "exception_type": type(exc).__name__,
             "exception_message": str(exc),
-            "traceback": traceback.format_exc() if settings.DEBUG else None,
+            "traceback": tb,
         }
 
     return JSONResponse(status_code=status_code, content=content)